@@ -7,11 +7,25 @@ Claude to filter for interesting interactive viewers.
 """
 
 import os
+import re
+import functools
 import json
-import requests
-from datetime import datetime, timedelta
+import itertools
+import random
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from anthropic import Anthropic
+from typing import TYPE_CHECKING
+
+# requests, orjson and anthropic are imported where they're used; they
+# dominate the script's start-up time otherwise
+if TYPE_CHECKING:
+    from anthropic import Anthropic
+    from requests import Session
 
 
 # Configuration
@@ -24,34 +38,256 @@ SEARCH_QUERIES = [
     "3d gaussian splat",
     "gaussian splat viewer",
 ]
+# Retry policy for rate-limited and transient GitHub API failures
+MAX_ATTEMPTS = 3
+RETRY_STATUSES = {403, 429, 502, 503, 504}
+MAX_RETRY_WAIT = 90
+# Upper bound on results kept per search, across all pages
+MAX_SEARCH_RESULTS = 500
+# Repos already reported are skipped for this many days
+SEEN_REPOS_FILE = ".seen_repos.json"
+SEEN_REPOS_TTL_DAYS = 30
+# Search responses cached for conditional requests (If-None-Match)
+ETAG_CACHE_FILE = ".etags.json"
+CACHED_REPO_FIELDS = (
+    "full_name",
+    "description",
+    "html_url",
+    "stargazers_count",
+    "language",
+    "created_at",
+    "pushed_at",
+    "topics",
+)
+# README enrichment: fetched concurrently, cached by full_name + pushed_at
+RAW_GITHUB_URL = "https://raw.githubusercontent.com"
+README_CACHE_FILE = ".readmes.json"
+README_MAX_BYTES = 4096
+README_PROMPT_CHARS = 500
+README_WORKERS = 10
+# Repos in these languages with no stars and no viewer keywords are almost
+# always training/research code, so they are dropped before calling Claude
+NON_VIEWER_LANGUAGES = {"Python", "Cuda", "Jupyter Notebook", None}
+VIEWER_KEYWORDS = {
+    "viewer", "viewers", "web", "webgl", "webgpu", "wasm",
+    "js", "ts", "three", "threejs",
+}
+# Claude models: a fast classifier shortlists viewers, the larger model
+# writes up the shortlist
+CLASSIFIER_MODEL = "claude-3-5-haiku-20241022"
+# Budget for a quoted "owner/repo" name per repo, up to Haiku's output limit
+CLASSIFIER_TOKENS_PER_REPO = 32
+CLASSIFIER_MAX_TOKENS = 8192
+ANALYSIS_MODEL = "claude-sonnet-4-20250514"
+# JSON is far terser than prose, but leave room for a long shortlist
+ANALYSIS_MAX_TOKENS = 2048
+EXCLUDE_CRITERIA = """Exclude:
+- Training/research code (CUDA kernels, model training scripts)
+- Raw data/datasets
+- Python-only tools with no viewer component
+- Forks of existing projects (should already be filtered out)
+- Academic paper implementations without viewer
+- Purely backend/API projects"""
+# Fenced code block holding the JSON part of a Claude response
+JSON_FENCE_RE = re.compile(r"```(?:json)?\s*\n(.*?)```", re.DOTALL)
+# One entry per repo in the Claude prompts; descriptions, topics and READMEs
+# are trimmed since every prompt character costs input tokens
+REPO_PROMPT_TEMPLATE = (
+    "- **{name}** ({language}, {stars} stars)\n"
+    "  Description: {description}\n"
+    "  Topics: {topics}\n"
+    "  README: {readme}"
+)
+PROMPT_DESCRIPTION_CHARS = 200
+PROMPT_MAX_TOPICS = 8
+# GitHub search allows at most five AND/OR/NOT operators per query
+MAX_OR_TERMS = 6
+
+
+def build_search_queries(queries: list = SEARCH_QUERIES) -> list:
+    """
+    Fold search terms into as few OR-combined GitHub queries as possible.
+
+    Args:
+        queries: Individual search terms
+
+    Returns:
+        List of compound query strings, each with at most MAX_OR_TERMS terms
+    """
+    return [
+        "(" + " OR ".join(f'"{q}"' for q in queries[i:i + MAX_OR_TERMS]) + ")"
+        for i in range(0, len(queries), MAX_OR_TERMS)
+    ]
+
+
+_github_headers_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def github_header_cycle() -> itertools.cycle:
+    """
+    Build GitHub API headers once per configured token, cycled round-robin.
+
+    Tokens are read from GITHUB_TOKENS (comma-separated), falling back to
+    GITHUB_TOKEN. Spreading requests across tokens multiplies the per-token
+    search rate limit.
+    """
+    raw = os.environ.get("GITHUB_TOKENS") or os.environ.get("GITHUB_TOKEN", "")
+    tokens = [t.strip() for t in raw.split(",") if t.strip()]
+    if not tokens:
+        raise ValueError(
+            "GITHUB_TOKENS or GITHUB_TOKEN environment variable is required"
+        )
+    return itertools.cycle([
+        {
+            "Authorization": f"token {token}",
+            "Accept": "application/vnd.github.v3+json",
+        }
+        for token in tokens
+    ])
 
 
 def get_github_headers():
-    """Get headers for GitHub API requests."""
-    token = os.environ.get("GITHUB_TOKEN")
-    if not token:
-        raise ValueError("GITHUB_TOKEN environment variable is required")
-    return {
-        "Authorization": f"token {token}",
-        "Accept": "application/vnd.github.v3+json",
-    }
+    """Get headers for GitHub API requests, using the next token in rotation."""
+    with _github_headers_lock:
+        # Copy so callers can add per-request headers without affecting others
+        return dict(next(github_header_cycle()))
+
+
+@functools.lru_cache(maxsize=1)
+def get_session() -> "Session":
+    """Create one shared session so requests reuse pooled TLS connections."""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    # Size each host's pool for the largest batch of concurrent requests, so
+    # connections aren't discarded when the pool fills up
+    pool_size = max(README_WORKERS, len(build_search_queries()))
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    return session
+
+
+@functools.lru_cache(maxsize=1)
+def get_anthropic_client() -> "Anthropic":
+    """Create the Anthropic client once and reuse it for every call."""
+    from anthropic import Anthropic
+
+    api_key = os.environ.get("ANTHROPIC_API_KEY")
+    if not api_key:
+        raise ValueError("ANTHROPIC_API_KEY environment variable is required")
+    return Anthropic(api_key=api_key)
 
 
-def search_github_repos(query: str, created_after: str) -> list:
+def retry_delay(response, attempt: int) -> float:
+    """
+    Work out how long to wait before retrying a failed GitHub request.
+
+    Args:
+        response: The failed response, or None for timeouts/connection errors
+        attempt: Zero-based attempt number that just failed
+
+    Returns:
+        Seconds to sleep, honoring Retry-After and X-RateLimit-Reset when set
+    """
+    delay = 2 ** attempt + random.random()
+    if response is not None:
+        retry_after = response.headers.get("Retry-After")
+        reset = response.headers.get("X-RateLimit-Reset")
+        if retry_after and retry_after.isdigit():
+            delay = int(retry_after)
+        elif response.headers.get("X-RateLimit-Remaining") == "0" and reset:
+            delay = max(int(reset) - time.time(), 0) + 1
+    return min(delay, MAX_RETRY_WAIT)
+
+
+def github_get(url: str, headers: dict, params: dict | None = None):
+    """
+    GET a GitHub API URL, retrying rate limits and transient errors.
+
+    Retries up to MAX_ATTEMPTS times with exponential backoff on timeouts,
+    connection errors, 429/5xx responses and rate-limited 403s.
+
+    Args:
+        url: GitHub API URL
+        headers: Request headers
+        params: Optional query parameters
+
+    Returns:
+        The final response, which may still be an error
+    """
+    import requests
+
+    session = get_session()
+    for attempt in range(MAX_ATTEMPTS):
+        last_attempt = attempt == MAX_ATTEMPTS - 1
+        try:
+            response = session.get(url, headers=headers, params=params, timeout=30)
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+            if last_attempt:
+                raise
+            response = None
+        else:
+            # A plain 403 (no rate-limit headers) is a permission error
+            rate_limited = (
+                response.headers.get("X-RateLimit-Remaining") == "0"
+                or "Retry-After" in response.headers
+            )
+            if (
+                last_attempt
+                or response.status_code not in RETRY_STATUSES
+                or (response.status_code == 403 and not rate_limited)
+            ):
+                return response
+
+        delay = retry_delay(response, attempt)
+        status = response.status_code if response is not None else "no response"
+        print(f"GitHub request failed ({status}), retrying in {delay:.1f}s...")
+        time.sleep(delay)
+
+
+def search_github_repos(
+    query: str, created_after: str, etag_cache: dict | None = None
+) -> list:
     """
     Search GitHub for repos matching query created after a date.
 
     Args:
         query: Search query string
         created_after: ISO date string (YYYY-MM-DD)
+        etag_cache: Optional dict of previous responses keyed by query; used
+            to send If-None-Match and updated in place
 
     Returns:
-        List of repo dictionaries
+        List of repo dictionaries, following pagination up to
+        MAX_SEARCH_RESULTS; partial results are returned if a later page fails
     """
+    import orjson
+    import requests
+
     headers = get_github_headers()
 
-    # Build search query with date filter, excluding forks
-    search_query = f"{query} created:>{created_after} fork:false"
+    # Build search query with date filter, excluding forks and archived
+    # repos server-side so they never reach Claude. A pushed:> qualifier
+    # would be a no-op here: pushed_at is never earlier than created_at.
+    search_query = (
+        f"{query} created:>{created_after} fork:false archived:false"
+    )
+
+    # Reuse the last response for this exact query if GitHub says it's fresh
+    # (entries that don't match the expected shape are ignored)
+    cached = (etag_cache or {}).get(query)
+    if not (
+        isinstance(cached, dict)
+        and cached.get("search_query") == search_query
+        and isinstance(cached.get("etag"), str)
+        and isinstance(cached.get("items"), list)
+        and all(isinstance(item, dict) for item in cached["items"])
+    ):
+        cached = None
+    if cached:
+        headers["If-None-Match"] = cached["etag"]
 
     params = {
         "q": search_query,
@@ -60,31 +296,47 @@ def search_github_repos(query: str, created_after: str) -> list:
         "per_page": 100,
     }
 
+    items = []
     try:
-        response = requests.get(
+        response = github_get(
             f"{GITHUB_API_URL}/search/repositories",
             headers=headers,
             params=params,
-            timeout=30
         )
-        response.raise_for_status()
-        data = response.json()
-        return data.get("items", [])
-    except requests.exceptions.RequestException as e:
+        if response.status_code == 304:
+            return cached["items"]
+        etag = response.headers.get("ETag")
+        headers.pop("If-None-Match", None)
+
+        # Follow Link: rel="next" until results run out or hit the cap
+        while True:
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            items.extend(data.get("items", []))
+            next_url = response.links.get("next", {}).get("url")
+            if not next_url or len(items) >= MAX_SEARCH_RESULTS:
+                break
+            response = github_get(next_url, headers=headers)
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
         print(f"Error searching GitHub for '{query}': {e}")
-        return []
-
-
-def deduplicate_repos(repos: list) -> list:
-    """Remove duplicate repos based on full_name."""
-    seen = set()
-    unique = []
-    for repo in repos:
-        full_name = repo.get("full_name", "")
-        if full_name and full_name not in seen:
-            seen.add(full_name)
-            unique.append(repo)
-    return unique
+        return items
+
+    total = data.get("total_count", len(items))
+    if total > MAX_SEARCH_RESULTS:
+        print(f"Warning: '{query}' matched {total} repos, keeping the first "
+              f"{MAX_SEARCH_RESULTS}")
+    items = items[:MAX_SEARCH_RESULTS]
+
+    if etag_cache is not None and etag:
+        etag_cache[query] = {
+            "search_query": search_query,
+            "etag": etag,
+            "items": [
+                {k: item[k] for k in CACHED_REPO_FIELDS if k in item}
+                for item in items
+            ],
+        }
+    return items
 
 
 def format_repo_for_analysis(repo: dict) -> dict:
@@ -96,91 +348,368 @@ def format_repo_for_analysis(repo: dict) -> dict:
         "stars": repo.get("stargazers_count", 0),
         "language": repo.get("language", "Unknown"),
         "created_at": repo.get("created_at", ""),
+        "pushed_at": repo.get("pushed_at", ""),
         "topics": repo.get("topics", []),
     }
 
 
-def analyze_with_claude(repos: list) -> str:
+def fetch_readme(repo: dict) -> str | None:
+    """
+    Fetch the start of a repo's README from the raw GitHub CDN.
+
+    Args:
+        repo: Formatted repo dictionary
+
+    Returns:
+        Up to README_MAX_BYTES of README text, "" if the repo has no
+        README.md, or None if the fetch failed and should be retried later
+    """
+    import requests
+
+    url = f"{RAW_GITHUB_URL}/{repo['name']}/HEAD/README.md"
+    try:
+        # Read the whole (small) body so the connection goes back to the pool
+        response = get_session().get(url, timeout=10)
+    except requests.exceptions.RequestException as e:
+        print(f"Error fetching README for '{repo['name']}': {e}")
+        return None
+    if response.status_code == 404:
+        return ""
+    if response.status_code != 200:
+        print(f"Error fetching README for '{repo['name']}': "
+              f"HTTP {response.status_code}")
+        return None
+    return response.content[:README_MAX_BYTES].decode("utf-8", errors="replace")
+
+
+def enrich_with_readmes(repos: list, readme_cache: dict) -> None:
+    """
+    Attach a "readme" field to each repo, fetching uncached READMEs in parallel.
+
+    Args:
+        repos: List of formatted repo dictionaries, updated in place
+        readme_cache: Dict mapping full_name to {"pushed_at", "readme"};
+            refreshed in place for repos pushed since they were cached.
+            Failed fetches are not cached, so a re-run retries them.
+    """
+    def is_fresh(repo: dict) -> bool:
+        entry = readme_cache.get(repo["name"])
+        return (
+            isinstance(entry, dict)
+            and entry.get("pushed_at") == repo["pushed_at"]
+            and isinstance(entry.get("readme"), str)
+        )
+
+    # Malformed cache entries count as misses and get refetched
+    missing = [r for r in repos if not is_fresh(r)]
+    if missing:
+        print(f"Fetching {len(missing)} READMEs...")
+        with ThreadPoolExecutor(max_workers=README_WORKERS) as executor:
+            for repo, readme in zip(missing, executor.map(fetch_readme, missing)):
+                if readme is not None:
+                    readme_cache[repo["name"]] = {
+                        "pushed_at": repo["pushed_at"],
+                        "readme": readme,
+                    }
+    for repo in repos:
+        repo["readme"] = readme_cache[repo["name"]]["readme"] if is_fresh(repo) else ""
+
+
+def is_plausible_viewer(repo: dict) -> bool:
+    """
+    Cheap pre-filter for repos worth sending to Claude.
+
+    Args:
+        repo: Formatted repo dictionary
+
+    Returns:
+        False for zero-star repos in a non-viewer language whose description
+        and topics mention no viewer keyword, True otherwise
+    """
+    if repo["language"] not in NON_VIEWER_LANGUAGES or repo["stars"]:
+        return True
+    text = " ".join([repo["description"] or "", *repo["topics"]]).lower()
+    return not VIEWER_KEYWORDS.isdisjoint(re.findall(r"[a-z0-9]+", text))
+
+
+def read_json_cache(path: Path) -> dict:
+    """Read a JSON cache file, returning an empty dict if missing or corrupt."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"Ignoring unreadable cache {path}: {e}")
+        return {}
+    if not isinstance(data, dict):
+        print(f"Ignoring cache {path}: expected a JSON object")
+        return {}
+    return data
+
+
+def write_json_cache(data: dict, path: Path) -> None:
+    """Atomically write a JSON cache file via a temp file and os.replace."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def load_seen_repos(findings_dir: Path, now: datetime) -> dict:
+    """
+    Load the cross-run cache of already-reported repos, dropping stale entries.
+
+    Args:
+        findings_dir: Path to findings directory
+        now: Current time (UTC), used to expire entries older than the TTL
+
+    Returns:
+        Dict mapping repo full_name to the ISO timestamp it was first seen
+    """
+    seen = read_json_cache(findings_dir / SEEN_REPOS_FILE)
+    cutoff = now - timedelta(days=SEEN_REPOS_TTL_DAYS)
+    fresh = {}
+    for name, first_seen in seen.items():
+        try:
+            seen_at = datetime.fromisoformat(first_seen)
+        except (TypeError, ValueError):
+            print(f"Ignoring bad seen-repos entry {name!r}: {first_seen!r}")
+            continue
+        if seen_at.tzinfo is None:
+            # Entries written before timestamps were timezone-aware
+            seen_at = seen_at.replace(tzinfo=timezone.utc)
+        if seen_at > cutoff:
+            fresh[name] = first_seen
+    return fresh
+
+
+def save_seen_repos(seen: dict, findings_dir: Path) -> None:
+    """
+    Atomically write the seen-repos cache to the findings directory.
+
+    Args:
+        seen: Dict mapping repo full_name to first-seen ISO timestamp
+        findings_dir: Path to findings directory
+    """
+    write_json_cache(seen, findings_dir / SEEN_REPOS_FILE)
+
+
+class AnalysisError(Exception):
+    """Raised when the Claude analysis fails or returns an unusable response."""
+
+
+def format_repo_for_prompt(repo: dict) -> str:
+    """Render one repo for a Claude prompt, keeping only the fields it uses."""
+    description = repo["description"] or "None"
+    if len(description) > PROMPT_DESCRIPTION_CHARS:
+        description = description[:PROMPT_DESCRIPTION_CHARS - 1].rstrip() + "…"
+    readme = " ".join(repo.get("readme", "")[:README_PROMPT_CHARS].split())
+    return REPO_PROMPT_TEMPLATE.format(
+        name=repo["name"],
+        language=repo["language"],
+        stars=repo["stars"],
+        description=description,
+        topics=", ".join(repo["topics"][:PROMPT_MAX_TOPICS]) or "None",
+        readme=readme or "None",
+    )
+
+
+def format_repo_list(repos: list) -> str:
+    """Format repos as a markdown bullet list for a Claude prompt."""
+    return "\n".join(format_repo_for_prompt(r) for r in repos)
+
+
+def parse_json_response(text: str):
+    """
+    Parse the JSON payload of a Claude response.
+
+    Prefers a ```json fenced block; otherwise decodes the first bracket in
+    the text that starts valid JSON, ignoring any prose around it.
+    """
+    fenced = JSON_FENCE_RE.search(text)
+    if fenced:
+        return json.loads(fenced.group(1))
+    decoder = json.JSONDecoder()
+    for match in re.finditer(r"[\[{]", text):
+        try:
+            return decoder.raw_decode(text, match.start())[0]
+        except ValueError:
+            continue
+    raise ValueError("No JSON found in response")
+
+
+def shortlist_viewers(client: "Anthropic", repos: list) -> list:
+    """
+    Use a fast, cheap model to pick out repos that look like viewers.
+
+    Args:
+        client: Anthropic client
+        repos: List of formatted repo dictionaries
+
+    Returns:
+        Subset of repos classified as interactive viewers; all repos if the
+        classifier's response can't be parsed
+
+    Raises:
+        AnalysisError: If the response is cut off at the token limit
+    """
+    prompt = f"""Here are GitHub repos related to 3D Gaussian Splatting:
+
+{format_repo_list(repos)}
+
+Which of these appear to be INTERACTIVE VIEWERS or creative presentation tools (web-based, with UI, playable experiences)?
+
+{EXCLUDE_CRITERIA}
+
+Respond with ONLY a JSON array of the matching repo names, e.g. ["owner/repo"]. Respond with [] if none match."""
+
+    # The reply is a list of names, so its length grows with the input
+    max_tokens = min(
+        max(512, CLASSIFIER_TOKENS_PER_REPO * len(repos)), CLASSIFIER_MAX_TOKENS
+    )
+    message = client.messages.create(
+        model=CLASSIFIER_MODEL,
+        max_tokens=max_tokens,
+        messages=[
+            {"role": "user", "content": prompt}
+        ]
+    )
+    if message.stop_reason == "max_tokens":
+        raise AnalysisError(
+            f"Classifier response was cut off at {max_tokens} tokens "
+            f"while shortlisting {len(repos)} repos"
+        )
+    try:
+        names = set(parse_json_response(message.content[0].text))
+    except (ValueError, TypeError) as e:
+        print(f"Could not parse classifier response, keeping all repos: {e}")
+        return repos
+    return [r for r in repos if r["name"] in names]
+
+
+def analyze_with_claude(repos: list) -> list:
     """
     Use Claude to analyze repos and identify interesting viewers.
 
+    A fast model first shortlists likely viewers; only the shortlist is sent
+    to the larger model, which returns a compact JSON summary per viewer.
+
     Args:
         repos: List of formatted repo dictionaries
 
     Returns:
-        Claude's analysis as markdown string
+        List of viewer dicts with name, url, why_interesting and stack keys
+
+    Raises:
+        AnalysisError: If a Claude call fails or its response can't be parsed
     """
-    api_key = os.environ.get("ANTHROPIC_API_KEY")
-    if not api_key:
-        raise ValueError("ANTHROPIC_API_KEY environment variable is required")
+    client = get_anthropic_client()
 
     if not repos:
-        return "No new repositories found in the last 24 hours."
-
-    # Format repos for the prompt
-    repo_list = "\n".join([
-        f"- **{r['name']}** ({r['language']}, {r['stars']} stars)\n"
-        f"  Description: {r['description']}\n"
-        f"  URL: {r['url']}\n"
-        f"  Topics: {', '.join(r['topics']) if r['topics'] else 'None'}"
-        for r in repos
-    ])
+        return []
+
+    try:
+        shortlist = shortlist_viewers(client, repos)
+    except AnalysisError:
+        raise
+    except Exception as e:
+        raise AnalysisError(e) from e
+    print(f"Classifier shortlisted {len(shortlist)} of {len(repos)} repos")
+    if not shortlist:
+        return []
 
     prompt = f"""Here are GitHub repos found in the last 24 hours related to 3D Gaussian Splatting:
 
-{repo_list}
+{format_repo_list(shortlist)}
 
 Which of these appear to be INTERACTIVE VIEWERS or creative presentation tools (web-based, with UI, playable experiences)?
 
-Exclude:
-- Training/research code (CUDA kernels, model training scripts)
-- Raw data/datasets
-- Python-only tools with no viewer component
-- Forks of existing projects (should already be filtered out)
-- Academic paper implementations without viewer
-- Purely backend/API projects
-
-For each interesting viewer project, provide:
-1. The repo name and URL
-2. What makes it interesting (unique features, novel approach, etc.)
-3. Technology stack if discernible
-
-If none of the repos appear to be interactive viewers, say so clearly.
+{EXCLUDE_CRITERIA}
 
-Format your response as markdown suitable for a daily report."""
+Respond with ONLY a JSON array inside a ```json fence, one object per interesting viewer project:
+[{{"name": "owner/repo", "why_interesting": "one or two sentences on unique features or novel approach", "stack": "technology stack if discernible, else empty"}}]
 
-    client = Anthropic(api_key=api_key)
+Respond with [] if none of the repos appear to be interactive viewers."""
 
     try:
         message = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=2048,
+            model=ANALYSIS_MODEL,
+            max_tokens=ANALYSIS_MAX_TOKENS,
             messages=[
                 {"role": "user", "content": prompt}
             ]
         )
-        return message.content[0].text
     except Exception as e:
-        return f"Error analyzing with Claude: {e}"
-
-
-def generate_daily_report(repos: list, analysis: str, date_str: str) -> str:
+        raise AnalysisError(e) from e
+    if message.stop_reason == "max_tokens":
+        raise AnalysisError(
+            f"Claude's response was cut off at {ANALYSIS_MAX_TOKENS} tokens "
+            f"while describing {len(shortlist)} shortlisted repos"
+        )
+    try:
+        entries = parse_json_response(message.content[0].text)
+    except ValueError as e:
+        raise AnalysisError(f"Could not parse Claude's response: {e}") from e
+    if not isinstance(entries, list):
+        raise AnalysisError("Expected a JSON array of viewers")
+
+    # Keep one entry per shortlisted repo and take the URL from GitHub's data
+    by_name = {r["name"]: r for r in shortlist}
+    viewers = {}
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        name = entry.get("name")
+        if name in by_name and name not in viewers:
+            viewers[name] = {
+                "name": name,
+                "url": by_name[name]["url"],
+                "why_interesting": entry.get("why_interesting") or "",
+                "stack": entry.get("stack") or "",
+            }
+    return list(viewers.values())
+
+
+def generate_daily_report(
+    repos: list, viewers: list, now: datetime, analysis_error: str = ""
+) -> str:
     """
     Generate the daily markdown report.
 
     Args:
         repos: List of all repos found
-        analysis: Claude's analysis
-        date_str: Date string for the report
+        viewers: Interesting viewers identified by Claude
+        now: Time of the scan (UTC), used for the title and footer
+        analysis_error: Error message to show if the Claude analysis failed
 
     Returns:
         Complete markdown report
     """
-    report = f"""# 3DGS Viewer Monitor - {date_str}
+    if analysis_error:
+        analysis = analysis_error
+    elif viewers:
+        analysis = "".join(f"""### [{v['name']}]({v['url']})
+
+- **Why it's interesting**: {v['why_interesting']}
+- **Stack**: {v['stack'] or 'Unknown'}
+
+""" for v in viewers).rstrip()
+    elif repos:
+        analysis = "None of the repos found appear to be interactive viewers."
+    else:
+        analysis = "No new repositories found in the last 24 hours."
+
+    parts = [f"""# 3DGS Viewer Monitor - {now.strftime("%Y-%m-%d")}
 
 ## Summary
 
 - **Repos scanned**: {len(repos)}
+- **Interesting viewers**: {len(viewers)}
 - **Search queries**: {', '.join(SEARCH_QUERIES)}
 - **Time range**: Last 24 hours
 
@@ -190,11 +719,10 @@ def generate_daily_report(repos: list, analysis: str, date_str: str) -> str:
 
 ## All Repos Found
 
-"""
+"""]
 
     if repos:
-        for repo in repos:
-            report += f"""### [{repo['name']}]({repo['url']})
+        parts.extend(f"""### [{repo['name']}]({repo['url']})
 
 - **Language**: {repo['language']}
 - **Stars**: {repo['stars']}
@@ -202,16 +730,16 @@ def generate_daily_report(repos: list, analysis: str, date_str: str) -> str:
 - **Topics**: {', '.join(repo['topics']) if repo['topics'] else 'None'}
 - **Description**: {repo['description']}
 
-"""
+""" for repo in repos)
     else:
-        report += "*No new repos found in the last 24 hours.*\n"
+        parts.append("*No new repos found in the last 24 hours.*\n")
 
-    report += f"""
+    parts.append(f"""
 ---
-*Generated at {datetime.utcnow().isoformat()}Z by 3DGS Viewer Monitor*
-"""
+*Generated at {now.isoformat()} by 3DGS Viewer Monitor*
+""")
 
-    return report
+    return "".join(parts)
 
 
 def save_report(report: str, date_str: str, findings_dir: Path) -> Path:
@@ -228,53 +756,124 @@ def save_report(report: str, date_str: str, findings_dir: Path) -> Path:
     """
     findings_dir.mkdir(parents=True, exist_ok=True)
     filepath = findings_dir / f"{date_str}.md"
-    filepath.write_text(report)
+    filepath.write_text(report, encoding="utf-8")
     return filepath
 
 
+def link_report(source: Path, target: Path) -> None:
+    """
+    Expose an already-written report at a second path without rewriting it.
+
+    Hardlinks when possible, falling back to a copy (e.g. across filesystems).
+
+    Args:
+        source: Path to the saved report
+        target: Path where the report should also appear
+    """
+    target.unlink(missing_ok=True)
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
+
+
 def main():
     """Main entry point for the scanner."""
     print("Starting 3DGS Viewer Monitor scan...")
 
     # Calculate date range (last 24 hours)
-    now = datetime.utcnow()
+    now = datetime.now(timezone.utc)
     yesterday = now - timedelta(days=1)
     created_after = yesterday.strftime("%Y-%m-%d")
     date_str = now.strftime("%Y-%m-%d")
 
     print(f"Searching for repos created after {created_after}")
 
-    # Search for repos across all queries
-    all_repos = []
-    for query in SEARCH_QUERIES:
-        print(f"Searching: '{query}'...")
-        repos = search_github_repos(query, created_after)
-        print(f"  Found {len(repos)} repos")
-        all_repos.extend(repos)
-
-    # Deduplicate
-    unique_repos = deduplicate_repos(all_repos)
-    print(f"Total unique repos found: {len(unique_repos)}")
-
-    # Format for analysis
-    formatted_repos = [format_repo_for_analysis(r) for r in unique_repos]
+    script_dir = Path(__file__).parent
+    findings_dir = script_dir / "findings"
+    seen_repos = load_seen_repos(findings_dir, now)
+    etag_cache = read_json_cache(findings_dir / ETAG_CACHE_FILE)
+
+    # Search for repos using OR-combined queries, run concurrently; each
+    # query is a blocking HTTPS round-trip, so fan them out instead of
+    # waiting in turn
+    queries = build_search_queries()
+    unique_repos = {}
+    print(f"Searching {len(queries)} combined queries...")
+    with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+        results = executor.map(
+            lambda q: search_github_repos(q, created_after, etag_cache), queries
+        )
+        for query, repos in zip(queries, results):
+            print(f"  '{query}': found {len(repos)} repos")
+            # Deduplicate on insert and format for analysis in the same pass
+            for repo in repos:
+                full_name = repo.get("full_name")
+                if full_name and full_name not in unique_repos:
+                    unique_repos[full_name] = format_repo_for_analysis(repo)
+    write_json_cache(
+        {q: etag_cache[q] for q in queries if q in etag_cache},
+        findings_dir / ETAG_CACHE_FILE,
+    )
+
+    formatted_repos = list(unique_repos.values())
+    print(f"Total unique repos found: {len(formatted_repos)}")
+
+    # Skip repos reported on a previous day; repos first seen today are kept
+    # so a same-day re-run regenerates the full report instead of an empty one
+    formatted_repos = [
+        r for r in formatted_repos
+        if seen_repos.get(r["name"], date_str) >= date_str
+    ]
+    print(f"Repos not reported on a previous day: {len(formatted_repos)}")
+
+    # Drop obvious non-viewers so they don't cost Claude input tokens
+    candidates = [r for r in formatted_repos if is_plausible_viewer(r)]
+    print(
+        f"Plausible viewers: {len(candidates)} "
+        f"({len(formatted_repos) - len(candidates)} pre-filtered)"
+    )
+
+    # Give Claude the start of each candidate's README as extra context
+    readme_cache = read_json_cache(findings_dir / README_CACHE_FILE)
+    enrich_with_readmes(candidates, readme_cache)
+    write_json_cache(
+        {
+            r["name"]: readme_cache[r["name"]]
+            for r in candidates if r["name"] in readme_cache
+        },
+        findings_dir / README_CACHE_FILE,
+    )
 
     # Analyze with Claude
-    print("Analyzing with Claude...")
-    analysis = analyze_with_claude(formatted_repos)
+    viewers = []
+    analysis_error = ""
+    if candidates:
+        print("Analyzing with Claude...")
+        try:
+            viewers = analyze_with_claude(candidates)
+        except AnalysisError as e:
+            analysis_error = f"Error analyzing with Claude: {e}"
+            print(analysis_error)
 
     # Generate report
-    report = generate_daily_report(formatted_repos, analysis, date_str)
+    report = generate_daily_report(
+        formatted_repos, viewers, now, analysis_error
+    )
 
     # Save to findings directory
-    script_dir = Path(__file__).parent
-    findings_dir = script_dir / "findings"
     filepath = save_report(report, date_str, findings_dir)
     print(f"Report saved to: {filepath}")
 
+    # Remember reported repos so later runs don't send them to Claude again
+    first_seen = now.isoformat()
+    for r in formatted_repos:
+        seen_repos.setdefault(r["name"], first_seen)
+    save_seen_repos(seen_repos, findings_dir)
+
     # Also save to a file that GitHub Actions can use for issue creation
     issue_file = script_dir / "latest_report.md"
-    issue_file.write_text(report)
+    link_report(filepath, issue_file)
     print(f"Issue file saved to: {issue_file}")
 
     # Print summary
@@ -282,7 +881,7 @@ def main():
     print("SCAN COMPLETE")
     print("=" * 60)
     print(f"Date: {date_str}")
-    print(f"Repos found: {len(unique_repos)}")
+    print(f"Repos found: {len(formatted_repos)}")
     print(f"Report: {filepath}")
 
     return 0